@@ -1,123 +1,336 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import polars as pl
+import polars.selectors as cs
+from numba import njit, prange
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 import seaborn as sns
+from scipy.stats import gaussian_kde
 from fpdf import FPDF
 
+# Column types for the supply chain CSV, so the reader skips type inference.
+# Counts and per-unit costs fit comfortably in 32 bits; revenue, price, route
+# costs and defect rates feed report figures directly and stay float64.
+INT_COLUMNS = [
+    'Availability', 'Number of products sold', 'Stock levels', 'Lead times',
+    'Order quantities', 'Shipping times', 'Lead time', 'Production volumes',
+    'Manufacturing lead time'
+]
+FLOAT32_COLUMNS = ['Shipping costs', 'Manufacturing costs']
+FLOAT64_COLUMNS = ['Price', 'Revenue generated', 'Defect rates', 'Costs']
+CATEGORICAL_COLUMNS = [
+    'Product type', 'Supplier name', 'Routes', 'Transportation modes',
+    'Shipping carriers', 'Location', 'Inspection results'
+]
+
+CSV_COLUMN_TYPES = {
+    **{col: pa.int32() for col in INT_COLUMNS},
+    **{col: pa.float32() for col in FLOAT32_COLUMNS},
+    **{col: pa.float64() for col in FLOAT64_COLUMNS},
+    **{col: pa.dictionary(pa.int32(), pa.string()) for col in CATEGORICAL_COLUMNS}
+}
+
+def _sorted_dictionary(column):
+    """Dictionary-encode a key column with its categories in name order"""
+    values = column.cast(pa.string()).combine_chunks()
+    dictionary = pc.drop_null(pc.unique(values))
+    dictionary = pc.take(dictionary, pc.sort_indices(dictionary))
+    indices = pc.index_in(values, value_set=dictionary).cast(pa.int32())
+    return pa.DictionaryArray.from_arrays(indices, dictionary)
+
+def _encode_categoricals(table, skip_encoded=False):
+    """Give the key columns sorted dictionaries, so they load as categoricals in name order"""
+    for col in CATEGORICAL_COLUMNS:
+        if skip_encoded and pa.types.is_dictionary(table.schema.field(col).type):
+            continue
+        table = table.set_column(
+            table.schema.get_field_index(col), col, _sorted_dictionary(table[col])
+        )
+    return table
+
+def read_supply_chain_table(path):
+    """Read the dataset as an Arrow table, from Parquet or from CSV with the pinned schema
+
+    A Parquet path is regenerated first from the CSV next to it when that
+    CSV is newer, so edits to the CSV are never silently ignored.
+    """
+    path = str(path)
+    if path.endswith('.parquet'):
+        csv_path = os.path.splitext(path)[0] + '.csv'
+        if os.path.exists(csv_path) and (
+            not os.path.exists(path) or os.path.getmtime(csv_path) > os.path.getmtime(path)
+        ):
+            convert_csv_to_parquet(csv_path, path)
+        # Files written by convert_csv_to_parquet already hold sorted dictionaries
+        return _encode_categoricals(pq.read_table(path), skip_encoded=True)
+    convert_options = pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES)
+    return _encode_categoricals(pacsv.read_csv(path, convert_options=convert_options))
+
+def convert_csv_to_parquet(csv_path, parquet_path):
+    """Write the CSV dataset out as Parquet, keeping the pinned column types"""
+    pq.write_table(read_supply_chain_table(csv_path), parquet_path)
+
+@njit(parallel=True, cache=True)
+def _risk_scores(stock_levels, lead_times, defect_rates, manufacturing_costs, mean_manufacturing_cost):
+    """Count the risk factors hit by each SKU in a single fused pass"""
+    n = stock_levels.shape[0]
+    scores = np.empty(n, np.uint8)
+    for i in prange(n):
+        scores[i] = (
+            np.uint8(stock_levels[i] < 20)
+            + np.uint8(lead_times[i] > 20)
+            + np.uint8(defect_rates[i] > 3)
+            + np.uint8(manufacturing_costs[i] > mean_manufacturing_cost)
+        )
+    return scores
+
 class SupplyChainAnalyzer:
     def __init__(self, data):
         """Initialize with supply chain dataset"""
-        self.data = pd.read_csv(data)
+        table = read_supply_chain_table(data)
+        self.data = table.to_pandas()
         self.product_metrics = None
         self.supplier_metrics = None
         self.logistics_metrics = None
 
-    def analyze_product_performance(self):
-        """Analyze product category and SKU performance"""
+    @staticmethod
+    def _with_report_dtypes(frame):
+        """Widen a Polars result to the dtypes pandas reads from the CSV: string keys, int64, float64"""
+        return frame.with_columns(
+            cs.categorical().cast(pl.String),
+            cs.integer().cast(pl.Int64),
+            cs.float().cast(pl.Float64)
+        )
+
+    @classmethod
+    def _to_pandas(cls, frame, keys):
+        """Convert a grouped Polars result to a pandas frame indexed by its keys"""
+        frame = cls._with_report_dtypes(frame.sort(keys))
+        return frame.to_pandas().set_index(keys).round(2)
+
+    @classmethod
+    def _rows_to_pandas(cls, frame):
+        """Convert a Polars row selection to pandas, keeping the original row labels"""
+        return cls._with_report_dtypes(frame).to_pandas().set_index('index').rename_axis(None)
+
+    def _fail_mask(self):
+        """Failed inspections in the current data, matched on the category code rather than the string"""
+        inspection_results = self.data['Inspection results'].cat
+        if 'Fail' not in inspection_results.categories:
+            return np.zeros(len(self.data), dtype=bool)
+        fail_code = inspection_results.categories.get_loc('Fail')
+        return inspection_results.codes.to_numpy() == fail_code
+
+    def _polars_frame(self):
+        """Lazy Polars view of the current data, with its row labels in an 'index' column"""
+        return pl.from_pandas(self.data.rename_axis('index'), include_index=True).lazy()
+
+    @staticmethod
+    def _collect(queries):
+        """Run a batch of lazy queries in one pass and return results by name"""
+        return dict(zip(queries, pl.collect_all(list(queries.values()))))
+
+    @staticmethod
+    def _product_queries(frame):
+        """Lazy queries behind the product metrics"""
+        rows = frame.with_row_index('position')
+
+        return {
+            # Integer columns are stored as int32; sum them as Int64 so totals cannot wrap
+            'category_performance': rows.group_by('Product type').agg([
+                pl.col('Revenue generated').sum(),
+                pl.col('Number of products sold').cast(pl.Int64).sum(),
+                pl.col('Stock levels').mean(),
+                pl.col('Defect rates').mean()
+            ]),
+
+            # Partial selection of the ten largest, then sort just those; ties
+            # go to the earliest row, like nlargest(keep='first')
+            'top_revenue_products': rows.top_k(
+                10, by=['Revenue generated', 'position'], reverse=[False, True]
+            ).sort(
+                ['Revenue generated', 'position'], descending=[True, False]
+            ).select(
+                ['index', 'SKU', 'Product type', 'Revenue generated', 'Number of products sold']
+            ),
+
+            'stock_alerts': rows.filter(pl.col('Stock levels') < 20).select(
+                ['index', 'SKU', 'Product type', 'Stock levels', 'Lead times']
+            )
+        }
+
+    @staticmethod
+    def _supplier_queries(frame):
+        """Lazy queries behind the supplier metrics"""
+        return {
+            'supplier_performance': frame.group_by('Supplier name').agg([
+                pl.col('Lead time').mean(),
+                pl.col('Manufacturing costs').mean(),
+                pl.col('Defect rates').mean(),
+                pl.col('Production volumes').cast(pl.Int64).sum()
+            ]),
+
+            # One hash pass; only combinations that occur are emitted
+            'supplier_locations': frame.group_by(['Supplier name', 'Location']).len(
+                name='shipment_count'
+            )
+        }
+
+    @staticmethod
+    def _logistics_queries(frame):
+        """Lazy queries behind the logistics metrics"""
+        return {
+            'carrier_performance': frame.group_by('Shipping carriers').agg([
+                pl.col('Shipping times').mean(),
+                pl.col('Shipping costs').mean(),
+                pl.col('Number of products sold').count()
+            ]),
+
+            'transport_cost_analysis': frame.group_by(['Transportation modes', 'Routes']).agg([
+                pl.col('Costs').mean(),
+                pl.col('Shipping times').mean()
+            ]),
+
+            'route_efficiency': frame.group_by('Routes').agg([
+                pl.col('Shipping times').mean().alias('Shipping times_mean'),
+                pl.col('Shipping times').min().alias('Shipping times_min'),
+                pl.col('Shipping times').max().alias('Shipping times_max'),
+                pl.col('Costs').mean().alias('Costs_mean')
+            ])
+        }
+
+    def _set_product_metrics(self, results):
+        """Shape the collected product results into product_metrics"""
         self.product_metrics = {
-            'category_performance': self.data.groupby('Product type').agg({
-                'Revenue generated': 'sum',
-                'Number of products sold': 'sum',
-                'Stock levels': 'mean',
-                'Defect rates': 'mean'
-            }).round(2),
-
-            'top_revenue_products': self.data.nlargest(10, 'Revenue generated')[
-                ['SKU', 'Product type', 'Revenue generated', 'Number of products sold']
-            ],
-
-            'stock_alerts': self.data[self.data['Stock levels'] < 20][
-                ['SKU', 'Product type', 'Stock levels', 'Lead times']
-            ]
+            'category_performance': self._to_pandas(results['category_performance'], 'Product type'),
+            'top_revenue_products': self._rows_to_pandas(results['top_revenue_products']),
+            'stock_alerts': self._rows_to_pandas(results['stock_alerts'])
         }
 
-    def analyze_supplier_performance(self):
-        """Analyze supplier performance metrics"""
+    def _set_supplier_metrics(self, results):
+        """Shape the collected supplier results into supplier_metrics"""
         self.supplier_metrics = {
-            'supplier_performance': self.data.groupby('Supplier name').agg({
-                'Lead time': 'mean',
-                'Manufacturing costs': 'mean',
-                'Defect rates': 'mean',
-                'Production volumes': 'sum'
-            }).round(2),
-
-            'supplier_locations': self.data.groupby(['Supplier name', 'Location']).size().reset_index(
-                name='shipment_count'
-            ),
+            'supplier_performance': self._to_pandas(results['supplier_performance'], 'Supplier name'),
 
-            'quality_issues': self.data[self.data['Inspection results'] == 'Fail'][
-                ['Supplier name', 'SKU', 'Defect rates']
-            ]
+            'supplier_locations': self._to_pandas(
+                results['supplier_locations'], ['Supplier name', 'Location']
+            ).reset_index(),
+
+            'quality_issues': self.data.loc[
+                self._fail_mask(), ['Supplier name', 'SKU', 'Defect rates']
+            ].astype({'Supplier name': str})
         }
 
-    def analyze_logistics(self):
-        """Analyze logistics and shipping performance"""
+    def _set_logistics_metrics(self, results):
+        """Shape the collected logistics results into logistics_metrics"""
+        route_efficiency = self._to_pandas(results['route_efficiency'], 'Routes')
+        route_efficiency.columns = pd.MultiIndex.from_tuples(
+            [tuple(col.rsplit('_', 1)) for col in route_efficiency.columns]
+        )
+
         self.logistics_metrics = {
-            'carrier_performance': self.data.groupby('Shipping carriers').agg({
-                'Shipping times': 'mean',
-                'Shipping costs': 'mean',
-                'Number of products sold': 'count'
-            }).round(2),
-
-            'transport_cost_analysis': self.data.groupby(['Transportation modes', 'Routes']).agg({
-                'Costs': 'mean',
-                'Shipping times': 'mean'
-            }).round(2),
-
-            'route_efficiency': self.data.groupby('Routes').agg({
-                'Shipping times': ['mean', 'min', 'max'],
-                'Costs': 'mean'
-            }).round(2)
+            'carrier_performance': self._to_pandas(results['carrier_performance'], 'Shipping carriers'),
+            'transport_cost_analysis': self._to_pandas(
+                results['transport_cost_analysis'], ['Transportation modes', 'Routes']
+            ),
+            'route_efficiency': route_efficiency
         }
 
-    def get_risk_assessment(self):
-        """Assess supply chain risks"""
-        risk_factors = pd.DataFrame({
-            'SKU': self.data['SKU'],
-            'Stock_Risk': self.data['Stock levels'] < 20,
-            'Lead_Time_Risk': self.data['Lead time'] > 20,
-            'Quality_Risk': self.data['Defect rates'] > 3,
-            'Cost_Risk': self.data['Manufacturing costs'] > self.data['Manufacturing costs'].mean()
+    def analyze_product_performance(self):
+        """Analyze product category and SKU performance"""
+        self._set_product_metrics(self._collect(self._product_queries(self._polars_frame())))
+
+    def analyze_supplier_performance(self):
+        """Analyze supplier performance metrics"""
+        self._set_supplier_metrics(self._collect(self._supplier_queries(self._polars_frame())))
+
+    def analyze_logistics(self):
+        """Analyze logistics and shipping performance"""
+        self._set_logistics_metrics(self._collect(self._logistics_queries(self._polars_frame())))
+
+    def analyze_all(self):
+        """Run the product, supplier and logistics analyses as one batch of queries"""
+        frame = self._polars_frame()
+        results = self._collect({
+            **self._product_queries(frame),
+            **self._supplier_queries(frame),
+            **self._logistics_queries(frame)
         })
 
-        risk_factors['Total_Risk_Score'] = (
-            risk_factors[['Stock_Risk', 'Lead_Time_Risk', 'Quality_Risk', 'Cost_Risk']]
-            .sum(axis=1)
+        self._set_product_metrics(results)
+        self._set_supplier_metrics(results)
+        self._set_logistics_metrics(results)
+
+    def get_risk_assessment(self):
+        """Assess supply chain risks"""
+        stock_levels = self.data['Stock levels'].to_numpy()
+        lead_times = self.data['Lead time'].to_numpy()
+        defect_rates = self.data['Defect rates'].to_numpy()
+        manufacturing_costs = self.data['Manufacturing costs'].to_numpy()
+        mean_manufacturing_cost = manufacturing_costs.mean()
+
+        risk_score = _risk_scores(
+            stock_levels, lead_times, defect_rates, manufacturing_costs, mean_manufacturing_cost
         )
 
-        return risk_factors[risk_factors['Total_Risk_Score'] >= 2]
+        # Individual factors are only needed for the flagged rows
+        at_risk = risk_score >= 2
+        return pd.DataFrame({
+            'SKU': self.data['SKU'].to_numpy()[at_risk],
+            'Stock_Risk': stock_levels[at_risk] < 20,
+            'Lead_Time_Risk': lead_times[at_risk] > 20,
+            'Quality_Risk': defect_rates[at_risk] > 3,
+            'Cost_Risk': manufacturing_costs[at_risk] > mean_manufacturing_cost,
+            'Total_Risk_Score': risk_score[at_risk]
+        }, index=self.data.index[at_risk])
 
     def generate_recommendations(self):
         """Generate actionable recommendations"""
         recommendations = []
 
+        costs = self.data['Costs'].to_numpy()
+        if len(costs) > 1:
+            cost_threshold = costs.mean(dtype=np.float64) + costs.std(ddof=1, dtype=np.float64)
+        else:
+            # The standard deviation is undefined, so no route counts as high-cost
+            cost_threshold = np.nan
+
+        low_stock_count = int((self.data['Stock levels'].to_numpy() < 20).sum())
+        quality_issue_count = int(self._fail_mask().sum())
+        high_cost_route_count = int((costs > cost_threshold).sum())
+
         # Inventory recommendations
-        low_stock = self.data[self.data['Stock levels'] < 20]
-        if not low_stock.empty:
+        if low_stock_count:
             recommendations.append({
                 'area': 'Inventory',
-                'issue': f'Low stock alerts for {len(low_stock)} SKUs',
+                'issue': f'Low stock alerts for {low_stock_count} SKUs',
                 'action': 'Reorder stocks for affected SKUs',
                 'priority': 'High'
             })
 
         # Quality recommendations
-        quality_issues = self.data[self.data['Inspection results'] == 'Fail']
-        if not quality_issues.empty:
+        if quality_issue_count:
             recommendations.append({
                 'area': 'Quality',
-                'issue': f'Quality failures in {len(quality_issues)} shipments',
+                'issue': f'Quality failures in {quality_issue_count} shipments',
                 'action': 'Review supplier quality control processes',
                 'priority': 'High'
             })
 
         # Logistics recommendations
-        high_cost_routes = self.data[self.data['Costs'] > self.data['Costs'].mean() + self.data['Costs'].std()]
-        if not high_cost_routes.empty:
+        if high_cost_route_count:
             recommendations.append({
                 'area': 'Logistics',
-                'issue': f'High shipping costs on {len(high_cost_routes)} routes',
+                'issue': f'High shipping costs on {high_cost_route_count} routes',
                 'action': 'Evaluate alternative shipping routes or carriers',
                 'priority': 'Medium'
             })
@@ -151,8 +364,8 @@ class SupplyChainAnalyzer:
         pdf.ln(10)
 
         # Write overall metrics
-        for key, value in report['overall_metrics'].items():
-            pdf.cell(0, 10, txt=f"{key}: {value}", ln=True)
+        body = "\n".join(f"{key}: {value}" for key, value in report['overall_metrics'].items())
+        pdf.multi_cell(0, 10, txt=body, align='L')
 
         # Add additional sections if needed
         pdf.ln(10)
@@ -160,80 +373,176 @@ class SupplyChainAnalyzer:
         print(f"Report saved to {file_name}")
 
 
-    def visualize_data(self):
-        """Generate visual insights"""
-        self.plot_category_performance()
-        self.plot_stock_levels()
-        self.plot_shipping_cost_density()
-        self.plot_shipping_cost_distribution()
+    def visualize_data(self, output_dir='.'):
+        """Generate visual insights, rendering the charts to PNG files in parallel"""
+        # Aggregate on this thread so the workers only draw
+        jobs = [
+            (self._draw_category_performance, self._category_revenue(),
+             'category_performance.png'),
+            (self._draw_stock_levels, self._stock_level_stats(),
+             'stock_levels.png'),
+            (self._draw_shipping_cost_density, self._shipping_cost_densities(),
+             'shipping_cost_density.png'),
+            (self._draw_shipping_cost_distribution, self._shipping_cost_stats(),
+             'shipping_cost_distribution.png')
+        ]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(draw, data, os.path.join(output_dir, file_name))
+                for draw, data, file_name in jobs
+            ]
 
-    def plot_shipping_costs(self):
+        # Leaving the pool waits for every chart; re-raise any worker error
+        for future in futures:
+            future.result()
+
+    def plot_shipping_costs(self, file_name='shipping_costs.png'):
         """Scatter plot of shipping costs vs. shipping times"""
-        plt.figure(figsize=(8, 6))
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
         sns.scatterplot(
             data=self.data,
             x='Shipping times',
             y='Shipping costs',
             hue='Transportation modes',
-            palette="deep"
+            palette="deep",
+            ax=ax
         )
-        plt.title("Shipping Costs vs. Times by Transportation Mode")
-        plt.xlabel("Shipping Times (days)")
-        plt.ylabel("Shipping Costs")
-        plt.legend(title="Transportation Mode")
-        plt.tight_layout()
-        plt.show()
-
-    def plot_category_performance(self):
+        ax.set_title("Shipping Costs vs. Times by Transportation Mode")
+        ax.set_xlabel("Shipping Times (days)")
+        ax.set_ylabel("Shipping Costs")
+        ax.legend(title="Transportation Mode")
+        fig.tight_layout()
+        fig.savefig(file_name)
+
+    @staticmethod
+    def _box_stats(groups):
+        """Quartiles, 1.5 IQR whiskers and outliers per group, in the form ax.bxp takes"""
+        stats = []
+        for label, values in groups:
+            values = values.to_numpy()
+            q1, med, q3 = np.percentile(values, [25, 50, 75])
+            iqr = q3 - q1
+            inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+            stats.append({
+                'label': label,
+                'q1': q1,
+                'med': med,
+                'q3': q3,
+                'whislo': inside.min(),
+                'whishi': inside.max(),
+                'fliers': values[(values < inside.min()) | (values > inside.max())]
+            })
+        return stats
+
+    @staticmethod
+    def _draw_boxes(ax, stats, cmap):
+        """Draw one filled box per group from precomputed statistics"""
+        boxes = ax.bxp(stats, patch_artist=True, medianprops={'color': 'black'})
+        colors = matplotlib.colormaps[cmap](np.linspace(0, 1, len(stats)))
+        for box, color in zip(boxes['boxes'], colors):
+            box.set_facecolor(color)
+
+    def _category_revenue(self):
+        """Total revenue per product type, largest first"""
+        category_data = self.data.groupby('Product type', observed=True)['Revenue generated'].sum()
+        return category_data.sort_values(ascending=False)
+
+    def _stock_level_stats(self):
+        """Box plot statistics of stock levels per product type"""
+        return self._box_stats(self.data.groupby('Product type', observed=True)['Stock levels'])
+
+    def _shipping_cost_stats(self):
+        """Box plot statistics of shipping costs per transportation mode"""
+        return self._box_stats(self.data.groupby('Transportation modes', observed=True)['Shipping costs'])
+
+    def _shipping_cost_densities(self):
+        """Evaluate a Gaussian KDE of shipping costs per transportation mode on a shared grid"""
+        costs = self.data['Shipping costs'].to_numpy()
+        kdes = {}
+        for mode, mode_costs in self.data.groupby('Transportation modes', observed=True)['Shipping costs']:
+            mode_costs = mode_costs.to_numpy()
+            # A KDE needs some spread; skip degenerate groups as seaborn does
+            if len(np.unique(mode_costs)) < 2:
+                warnings.warn(f"Skipping density for '{mode}': fewer than 2 distinct shipping costs")
+                continue
+            kdes[mode] = (gaussian_kde(mode_costs), len(mode_costs))
+
+        # Extend the curves three bandwidths past the data, as seaborn does
+        pad = 3 * max((np.sqrt(kde.covariance[0, 0]) for kde, _ in kdes.values()), default=0)
+        xs = np.linspace(costs.min() - pad, costs.max() + pad, 200)
+
+        # Scale by group share so the areas sum to one across modes
+        return xs, {mode: kde(xs) * count / len(costs) for mode, (kde, count) in kdes.items()}
+
+    @staticmethod
+    def _draw_category_performance(category_data, file_name):
+        """Save a bar chart of revenue by product category"""
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+        colors = matplotlib.colormaps['viridis'](np.linspace(0, 1, len(category_data)))
+        ax.bar(category_data.index.astype(str), category_data.to_numpy(), color=colors)
+        ax.set_title("Revenue by Product Category")
+        ax.set_xlabel("Product Type")
+        ax.set_ylabel("Revenue Generated")
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
+        fig.savefig(file_name)
+
+    @classmethod
+    def _draw_stock_levels(cls, stats, file_name):
+        """Save a box plot of stock levels by product category"""
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+        cls._draw_boxes(ax, stats, 'coolwarm')
+        ax.set_title("Stock Levels by Product Category")
+        ax.set_xlabel("Product Type")
+        ax.set_ylabel("Stock Levels")
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
+        fig.savefig(file_name)
+
+    @classmethod
+    def _draw_shipping_cost_distribution(cls, stats, file_name):
+        """Save a box plot of shipping costs by transportation mode"""
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+        cls._draw_boxes(ax, stats, 'Set3')
+        ax.set_title("Shipping Costs by Transportation Mode")
+        ax.set_xlabel("Transportation Mode")
+        ax.set_ylabel("Shipping Costs")
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
+        fig.savefig(file_name)
+
+    @staticmethod
+    def _draw_shipping_cost_density(densities, file_name):
+        """Save the per-mode shipping cost densities as filled curves"""
+        xs, mode_densities = densities
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+        for mode, density in mode_densities.items():
+            ax.fill_between(xs, density, alpha=0.5, label=mode)
+        ax.set_title("Density of Shipping Costs by Transportation Mode")
+        ax.set_xlabel("Shipping Costs")
+        ax.set_ylabel("Density")
+        ax.legend(title="Transportation modes")
+        fig.tight_layout()
+        fig.savefig(file_name)
+
+    def plot_category_performance(self, file_name='category_performance.png'):
         """Bar chart for revenue generated by product categories"""
-        category_data = self.data.groupby('Product type')['Revenue generated'].sum()
-        category_data = category_data.sort_values(ascending=False)
-
-        plt.figure(figsize=(10, 6))
-        sns.barplot(x=category_data.index, y=category_data.values, palette="viridis")
-        plt.title("Revenue by Product Category")
-        plt.xlabel("Product Type")
-        plt.ylabel("Revenue Generated")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.show()
-
-    def plot_stock_levels(self):
+        self._draw_category_performance(self._category_revenue(), file_name)
+
+    def plot_stock_levels(self, file_name='stock_levels.png'):
         """Box plot for stock levels across product categories"""
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(data=self.data, x='Product type', y='Stock levels', palette="coolwarm")
-        plt.title("Stock Levels by Product Category")
-        plt.xlabel("Product Type")
-        plt.ylabel("Stock Levels")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.show()
-
-    def plot_shipping_cost_distribution(self):
+        self._draw_stock_levels(self._stock_level_stats(), file_name)
+
+    def plot_shipping_cost_distribution(self, file_name='shipping_cost_distribution.png'):
         """Box plot of shipping costs by transportation mode"""
-        plt.figure(figsize=(10, 6))
-        sns.boxplot(data=self.data, x='Transportation modes', y='Shipping costs', palette="Set3")
-        plt.title("Shipping Costs by Transportation Mode")
-        plt.xlabel("Transportation Mode")
-        plt.ylabel("Shipping Costs")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.show()
-
-    def plot_shipping_cost_density(self):
-        """Density plot of shipping costs by transportation mode"""
-        plt.figure(figsize=(10, 6))
-        sns.kdeplot(
-            data=self.data,
-            x='Shipping costs',
-            hue='Transportation modes',
-            fill=True,
-            palette="muted",
-            alpha=0.5
-        )
-        plt.title("Density of Shipping Costs by Transportation Mode")
-        plt.xlabel("Shipping Costs")
-        plt.ylabel("Density")
-        plt.tight_layout()
-        plt.show()
+        self._draw_shipping_cost_distribution(self._shipping_cost_stats(), file_name)
 
+    def plot_shipping_cost_density(self, file_name='shipping_cost_density.png'):
+        """Density plot of shipping costs by transportation mode"""
+        self._draw_shipping_cost_density(self._shipping_cost_densities(), file_name)
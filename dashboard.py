@@ -1,18 +1,34 @@
-import pandas as pd
+from functools import lru_cache
 import dash
 from dash import dcc, html, callback
 from dash.dependencies import Input, Output
+from dash.exceptions import PreventUpdate
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from analyzer import read_supply_chain_table
 
 # Load and prepare data
-df = pd.read_csv('data/supply_chain_data.csv')
+# Shared loader: group and filter keys arrive as categoricals in name order,
+# so comparisons run on integer codes
+df = read_supply_chain_table('data/supply_chain_data.parquet').to_pandas()
 
-# Calculate additional metrics
-df['efficiency_score'] = (100 - df['Defect rates'] * 20 - df['Lead time'] / 30 * 100).clip(0, 100)
-df['cost_effectiveness'] = (df['Revenue generated'] / df['Manufacturing costs']).clip(0, 100)
+# Calculate additional metrics (numexpr evaluates each expression in one pass)
+df.eval("""
+efficiency_score = 100 - `Defect rates` * 20 - `Lead time` / 30 * 100
+cost_effectiveness = `Revenue generated` / `Manufacturing costs`
+""", engine='numexpr', inplace=True)
+df[['efficiency_score', 'cost_effectiveness']] = df[['efficiency_score', 'cost_effectiveness']].clip(0, 100)
+
+# Per-product rows and KPIs, computed once so callbacks only do lookups
+product_groups = dict(tuple(df.groupby('Product type', observed=True)))
+product_kpis = df.groupby('Product type', observed=True).agg({
+    'Revenue generated': 'sum',
+    'Lead time': 'mean',
+    'efficiency_score': 'mean',
+    'cost_effectiveness': 'mean'
+}).to_dict('index')
 
 # Custom dark theme
 dark_theme = {
@@ -82,8 +98,8 @@ app.layout = html.Div([
         html.Label('Product Type', style={'color': dark_theme['text']}),
         dcc.Dropdown(
             id='product-filter',
-            options=[{'label': x, 'value': x} for x in df['Product type'].unique()],
-            value=df['Product type'].unique()[0],
+            options=[{'label': x, 'value': x} for x in df['Product type'].cat.categories],
+            value=df['Product type'].cat.categories[0],
             style={'backgroundColor': 'white', 'color': 'black'}
         ),
     ], style={'width': '30%', 'margin': '20px auto'}),
@@ -139,6 +155,8 @@ app.layout = html.Div([
 ])
 
 # Callbacks
+# Figures depend only on the selected product, so each figure callback is
+# memoized per product and returns a plain dict that is never mutated
 @callback(
     [Output('total-revenue', 'children'),
      Output('avg-lead-time', 'children'),
@@ -147,12 +165,16 @@ app.layout = html.Div([
     [Input('product-filter', 'value')]
 )
 def update_kpis(selected_product):
-    filtered_df = df[df['Product type'] == selected_product]
+    # Clearing the dropdown sends None; keep the current view
+    if selected_product not in product_groups:
+        raise PreventUpdate
+
+    kpis = product_kpis[selected_product]
     
-    revenue = f"${filtered_df['Revenue generated'].sum():,.0f}"
-    lead_time = f"{filtered_df['Lead time'].mean():.1f} days"
-    efficiency = f"{filtered_df['efficiency_score'].mean():.1f}%"
-    cost_effect = f"{filtered_df['cost_effectiveness'].mean():.1f}x"
+    revenue = f"${kpis['Revenue generated']:,.0f}"
+    lead_time = f"{kpis['Lead time']:.1f} days"
+    efficiency = f"{kpis['efficiency_score']:.1f}%"
+    cost_effect = f"{kpis['cost_effectiveness']:.1f}x"
     
     return revenue, lead_time, efficiency, cost_effect
 
@@ -160,9 +182,12 @@ def update_kpis(selected_product):
     Output('gauge-chart', 'figure'),
     [Input('product-filter', 'value')]
 )
+@lru_cache(maxsize=None)
 def update_gauge(selected_product):
-    filtered_df = df[df['Product type'] == selected_product]
-    efficiency = filtered_df['efficiency_score'].mean()
+    if selected_product not in product_groups:
+        raise PreventUpdate
+
+    efficiency = product_kpis[selected_product]['efficiency_score']
     
     fig = go.Figure(go.Indicator(
         mode = "gauge+number",
@@ -187,14 +212,18 @@ def update_gauge(selected_product):
         font = {'color': dark_theme['text']},
         height = 300
     )
-    return fig
+    return fig.to_dict()
 
 @callback(
     Output('spider-chart', 'figure'),
     [Input('product-filter', 'value')]
 )
+@lru_cache(maxsize=None)
 def update_spider(selected_product):
-    filtered_df = df[df['Product type'] == selected_product]
+    if selected_product not in product_groups:
+        raise PreventUpdate
+
+    filtered_df = product_groups[selected_product]
     metrics = ['Availability', 'Lead time', 'Defect rates', 'Manufacturing costs', 'Shipping costs']
     
     # Normalize values between 0 and 1
@@ -225,14 +254,18 @@ def update_spider(selected_product):
         title = 'Performance Metrics',
         height = 300
     )
-    return fig
+    return fig.to_dict()
 
 @callback(
     Output('defect-trend', 'figure'),
     [Input('product-filter', 'value')]
 )
+@lru_cache(maxsize=None)
 def update_defect_trend(selected_product):
-    filtered_df = df[df['Product type'] == selected_product]
+    if selected_product not in product_groups:
+        raise PreventUpdate
+
+    filtered_df = product_groups[selected_product]
     
     fig = go.Figure()
     fig.add_trace(go.Box(
@@ -250,15 +283,19 @@ def update_defect_trend(selected_product):
         xaxis = {'gridcolor': dark_theme['grid']},
         yaxis = {'gridcolor': dark_theme['grid']}
     )
-    return fig
+    return fig.to_dict()
 
 @callback(
     Output('revenue-location', 'figure'),
     [Input('product-filter', 'value')]
 )
+@lru_cache(maxsize=None)
 def update_revenue_location(selected_product):
-    filtered_df = df[df['Product type'] == selected_product]
-    location_revenue = filtered_df.groupby('Location')['Revenue generated'].sum().reset_index()
+    if selected_product not in product_groups:
+        raise PreventUpdate
+
+    filtered_df = product_groups[selected_product]
+    location_revenue = filtered_df.groupby('Location', observed=True)['Revenue generated'].sum().reset_index()
     
     fig = px.bar(
         location_revenue,
@@ -276,15 +313,19 @@ def update_revenue_location(selected_product):
         xaxis = {'gridcolor': dark_theme['grid']},
         yaxis = {'gridcolor': dark_theme['grid']}
     )
-    return fig
+    return fig.to_dict()
 
 @callback(
     Output('supplier-performance', 'figure'),
     [Input('product-filter', 'value')]
 )
+@lru_cache(maxsize=None)
 def update_supplier_performance(selected_product):
-    filtered_df = df[df['Product type'] == selected_product]
-    supplier_metrics = filtered_df.groupby('Supplier name').agg({
+    if selected_product not in product_groups:
+        raise PreventUpdate
+
+    filtered_df = product_groups[selected_product]
+    supplier_metrics = filtered_df.groupby('Supplier name', observed=True).agg({
         'efficiency_score': 'mean',
         'cost_effectiveness': 'mean'
     }).reset_index()
@@ -321,7 +362,7 @@ def update_supplier_performance(selected_product):
         yaxis = {'gridcolor': dark_theme['grid']},
         yaxis2 = {'gridcolor': dark_theme['grid']}
     )
-    return fig
+    return fig.to_dict()
 
 if __name__ == '__main__':
     app.run_server(debug=True)
\ No newline at end of file
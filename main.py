@@ -1,14 +1,10 @@
 from analyzer import SupplyChainAnalyzer
 
-data_path = "data/supply_chain_data.csv"
+data_path = "data/supply_chain_data.parquet"
 
 my_analyzer = SupplyChainAnalyzer(data_path)
 
-my_analyzer.analyze_logistics()
-
-my_analyzer.analyze_product_performance()
-
-my_analyzer.analyze_supplier_performance()
+my_analyzer.analyze_all()
 
 my_analyzer.generate_recommendations()
 